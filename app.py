@@ -1,6 +1,7 @@
 from flask import Flask
 from flask_cors import CORS
 from routes.geocode import bp as geocode_bp
+from services import warmup
 
 def create_app():
     app = Flask(__name__)
@@ -19,6 +20,14 @@ def create_app():
     def root():
         return {"ok": True, "app": "Panacea backend"}
 
+    # Preload hazard snapshot, hospital catalogs and GEOS in the background;
+    # /api/health/ready stays 503 until this finishes. Started from the first
+    # request (normally the LB health probe) so only a process that actually
+    # serves warms up: not the reloader parent, not a --preload master.
+    @app.before_request
+    def _start_warmup():
+        warmup.start()
+
     return app
 
 if __name__ == "__main__":
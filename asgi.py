@@ -0,0 +1,42 @@
+# Async serving mode for the upstream-bound endpoints.
+# Same /api paths and responses as app.py, but one process can keep thousands of
+# requests parked on OSRM / Overpass / NWS / Nominatim instead of one per worker.
+#   hypercorn "asgi:create_async_app()" --bind 0.0.0.0:5002
+from quart import Quart
+from quart_cors import cors
+from utils.aio import close_client
+from services import warmup
+
+def create_async_app():
+    app = Quart(__name__)
+    app = cors(app)
+
+    # Register blueprints
+    from routes.async_health import bp as health_bp
+    from routes.async_flood import bp as flood_bp
+    from routes.async_hospital import bp as hospital_bp
+    from routes.async_geocode import bp as geocode_bp
+    app.register_blueprint(health_bp, url_prefix="/api")
+    app.register_blueprint(flood_bp, url_prefix="/api")
+    app.register_blueprint(hospital_bp, url_prefix="/api")
+    app.register_blueprint(geocode_bp, url_prefix="/api")
+
+    @app.get("/")
+    async def root():
+        return {"ok": True, "app": "Panacea backend (async)"}
+
+    # shares the caches with app.py, so the same warm-up applies; before_serving
+    # runs in each serving worker only
+    @app.before_serving
+    async def _start_warmup():
+        warmup.start()
+
+    @app.after_serving
+    async def _close_upstreams():
+        await close_client()
+
+    return app
+
+if __name__ == "__main__":
+    app = create_async_app()
+    app.run(port=5002, debug=True)
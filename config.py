@@ -6,3 +6,15 @@ TRANSTAR_POINT_BUFFER_METERS = 75   # avoidance radius around flood-prone points
 # To estrict alert fetch by bbox (Houston-ish)
 # west, south, east, north (lon/lat)
 DEFAULT_BBOX = (-95.9, 29.4, -95.0, 30.2)
+HOSPITAL_GRID_STEPS = 3   # hospital catalog cells: 3x3 over DEFAULT_BBOX (~30 km each), one cached Overpass fetch per cell
+
+# Async serving mode (asgi.py)
+ASYNC_MAX_UPSTREAM_CONNECTIONS = 200  # shared httpx pool across OSRM/Overpass/NWS/Nominatim/TranStar
+GEO_POOL_WORKERS = 4                  # threads for shapely work kept off the event loop
+ASYNC_OSRM_BATCH = 2                  # candidates routed concurrently per nearest-hospital request
+
+# Startup warm-up (services/warmup.py); /api/health/ready returns 503 until it finishes
+WARMUP_ENABLED = True
+WARMUP_WORKERS = 2         # parallel warm-up fetches per serving process; public Overpass allows ~2 slots per IP,
+                           # so with several workers per host set this to 1 (it still adds up across workers)
+WARMUP_MAX_SECONDS = 120   # report ready anyway after this, so a slow upstream can't pin us out of rotation
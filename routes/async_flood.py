@@ -0,0 +1,43 @@
+# Async twin of routes/flood.py for the ASGI app (asgi.py).
+import asyncio
+from quart import Blueprint, request, jsonify
+from shapely.geometry import mapping
+from config import DEFAULT_BBOX, FLOOD_BUFFER_METERS, TRANSTAR_POINT_BUFFER_METERS
+from services.nws import flood_alert_polygons_async
+from services.fim import fim_polygons
+from services.transtar import get_transtar_points_async
+from utils.aio import run_geo
+from utils.geo import flood_mask_geojson, points_buffered
+
+bp = Blueprint("async_flood", __name__)
+
+def _mask_geojson(bbox, polys, points):
+    """CPU half of flood_mask: union/buffer (cached) and serialise both layers."""
+    union_geojson = flood_mask_geojson(bbox, polys, FLOOD_BUFFER_METERS)
+
+    transtar_union = points_buffered(points, TRANSTAR_POINT_BUFFER_METERS) if points else None
+    transtar_geojson = mapping(transtar_union) if transtar_union else None
+    return union_geojson, transtar_geojson
+
+@bp.get("/flood-mask")
+async def flood_mask():
+    """
+    Same response as the sync /flood-mask:
+      { "polygon": <GeoJSON or null>, "transtar": <GeoJSON or null> }
+    """
+    bbox = request.args.get("bbox")
+    if bbox:
+        parts = [float(x) for x in bbox.split(",")]
+        bbox = tuple(parts)
+    else:
+        bbox = DEFAULT_BBOX
+
+    # NWS and TranStar in parallel
+    alert_polys, points = await asyncio.gather(
+        flood_alert_polygons_async(bbox=bbox),
+        get_transtar_points_async(),
+    )
+    fim_polys = fim_polygons(bbox=bbox)
+
+    union_geojson, transtar_geojson = await run_geo(_mask_geojson, bbox, alert_polys + fim_polys, points)
+    return jsonify({"polygon": union_geojson, "transtar": transtar_geojson})
@@ -0,0 +1,18 @@
+# Async twin of routes/geocode.py for the ASGI app (asgi.py).
+from quart import Blueprint, request, jsonify
+from services.nominatim import geocode_async
+
+bp = Blueprint("async_geocode", __name__)
+
+@bp.get("/geocode")
+async def geocode_route():
+    q = request.args.get("q", "").strip()
+    if not q:
+        return jsonify({"results": []})
+    try:
+        results = await geocode_async(q, limit=int(request.args.get("limit", 5)))
+        return jsonify({"results": results})
+    except Exception as e:
+        # Fail soft with empty list (do not 500 during demos)
+        print("[GEOCODE ERROR]", e)
+        return jsonify({"results": []})
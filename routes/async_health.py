@@ -0,0 +1,14 @@
+from quart import Blueprint
+from services import warmup
+
+bp = Blueprint("async_health", __name__)
+
+@bp.get("/health")
+async def health():
+    st = warmup.status()
+    return {"ok": True, "ready": st["ready"], "warmup": st}
+
+@bp.get("/health/ready")
+async def ready():
+    st = warmup.status()
+    return st, (200 if st["ready"] else 503)
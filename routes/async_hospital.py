@@ -0,0 +1,185 @@
+# backend/routes/async_hospital.py
+# Async twin of routes/hospital.py for the ASGI app (asgi.py).
+# Same query params and response shape; upstream calls are awaited concurrently
+# (OSRM in small batches) and the shapely work runs in the geometry thread pool.
+import asyncio
+from quart import Blueprint, request, jsonify
+from shapely.geometry import Point, mapping
+
+from services.overpass import get_hospitals_async
+from services.osrm import full_route_async
+from services.alerts import get_active_flood_polygons
+from services.fim import get_fim_polygons
+from services.transtar import get_transtar_points_async
+from config import ASYNC_OSRM_BATCH
+from routes.hospital import _bearing_deg, _dest_point, _initial_heading_from_route_geojson
+
+from utils.aio import run_geo
+from utils.geo import (
+    union_polygons,
+    buffer_meters,
+    haversine_km,
+    line_intersects_polygons,
+    line_near_points,
+    points_buffered,
+)
+
+bp = Blueprint("async_hospital", __name__)
+
+def _build_mask(lat, lon, prelim, nearest, transtar_pts, tube_m,
+                simulate, sim_radius_m, sim_offset_m, sim_lat_q, sim_lon_q):
+    """
+    CPU half of nearest_hospital, part 1: alerts/FIM + simulation + TranStar mask.
+    `prelim` is (hospital, route) for the first candidate OSRM could route to, or None.
+    Returns (mask, sim_polygon).
+    """
+    # base flood mask (alerts + optional FIM)
+    alert_polys = get_active_flood_polygons() or []
+    fim_polys = get_fim_polygons() or []
+    mask = union_polygons(alert_polys + fim_polys)
+    if mask:
+        mask = buffer_meters(mask, 100)  # be conservative
+
+    transtar_buffer = points_buffered(transtar_pts, tube_m) if transtar_pts else None
+
+    sim_polygon = None
+    if simulate:
+        if sim_lat_q is not None and sim_lon_q is not None:
+            try:
+                s_lat = float(sim_lat_q); s_lon = float(sim_lon_q)
+                sim_polygon = buffer_meters(Point(s_lon, s_lat), sim_radius_m)
+            except Exception:
+                sim_polygon = None
+        else:
+            # prelim route = first candidate (haversine order) with a route; already fetched
+            prelim_h, prelim_rt = prelim if prelim else (None, None)
+            heading = _initial_heading_from_route_geojson(prelim_rt["geometry"]) if prelim_rt else None
+            if heading is None:
+                h0 = prelim_h or nearest
+                heading = _bearing_deg(lat, lon, h0["lat"], h0["lon"])
+
+            center_dist_m = tube_m + sim_radius_m + sim_offset_m
+            c_lat, c_lon = _dest_point(lat, lon, heading, center_dist_m)
+            sim_polygon = buffer_meters(Point(c_lon, c_lat), sim_radius_m)
+
+    if sim_polygon is not None:
+        mask = sim_polygon if mask is None else mask.union(sim_polygon)
+    if transtar_buffer is not None:
+        mask = transtar_buffer if mask is None else mask.union(transtar_buffer)
+    return mask, sim_polygon
+
+def _first_clear(routed, mask, transtar_pts, tube_m):
+    """
+    CPU half of nearest_hospital, part 2: first (hospital, route) in `routed`
+    that avoids the mask and the TranStar points, or None.
+    """
+    for h, rt in routed:
+        geom = rt["geometry"]
+        crosses_poly = line_intersects_polygons(geom, mask) if mask is not None else False
+        near_sensors = line_near_points(geom, transtar_pts, meters=tube_m) if transtar_pts else False
+        if not crosses_poly and not near_sensors:
+            return h, rt
+    return None
+
+@bp.get("/nearest-hospital")
+async def nearest_hospital():
+    try:
+        lat = float(request.args.get("lat"))
+        lon = float(request.args.get("lon"))
+    except Exception:
+        return jsonify({"error": "lat/lon required"}), 400
+
+    try:
+        radius_km = float(request.args.get("radius_km", 20))
+    except Exception:
+        radius_km = 20.0
+    radius_km = max(1.0, min(radius_km, 50.0))  # clamp
+
+    tube_m = int(request.args.get("tube_m", 75))
+    simulate = request.args.get("simulate", "0") == "1"
+    sim_radius_m = int(request.args.get("sim_radius_m", 600))
+    sim_offset_m = int(request.args.get("sim_offset_m", 20))
+    sim_lat_q = request.args.get("sim_lat")
+    sim_lon_q = request.args.get("sim_lon")
+
+    origin = (lat, lon)
+
+    # 1) hospitals and TranStar points in parallel
+    hospitals, transtar_pts = await asyncio.gather(
+        get_hospitals_async(lat, lon, radius_km),
+        get_transtar_points_async(),
+        return_exceptions=True,
+    )
+    if isinstance(hospitals, Exception):
+        print("[OVERPASS ERROR]", hospitals)
+        hospitals = []
+    if isinstance(transtar_pts, Exception):
+        print("[TRANSTAR ERROR]", transtar_pts)
+        transtar_pts = []
+    transtar_pts = transtar_pts or []
+
+    if not hospitals:
+        return jsonify({
+            "origin": {"lat": lat, "lon": lon},
+            "best": None,
+            "route": None,
+            "radius_km": radius_km,
+            "warning": "No hospitals found in the area. Try increasing the radius.",
+            "sim_polygon": None
+        })
+
+    # shortlist by straight-line distance (sorted copy: the list is shared with the cache)
+    candidates = sorted(hospitals, key=lambda h: haversine_km(origin, (h["lat"], h["lon"])))[:10]
+
+    # 2) OSRM in small concurrent batches, haversine order, stopping at the first
+    #    clear route -- the sync route's early exit, without flooding the demo router
+    mask_args = (transtar_pts, tube_m, simulate, sim_radius_m, sim_offset_m, sim_lat_q, sim_lon_q)
+    mask = sim_polygon = None
+    mask_built = False
+    chosen = None
+    chosen_route = None
+    warning = None
+    best_by_road = None   # fallback: closest by road if all unsafe
+    best_by_road_rt = None
+
+    for i in range(0, len(candidates), ASYNC_OSRM_BATCH):
+        batch = candidates[i:i + ASYNC_OSRM_BATCH]
+        routes = await asyncio.gather(*(
+            full_route_async(origin, (h["lat"], h["lon"])) for h in batch
+        ))
+        routed = [(h, rt) for h, rt in zip(batch, routes) if rt and rt.get("geometry")]
+        if not routed:
+            continue
+
+        for h, rt in routed:
+            if not best_by_road_rt or rt["distance_km"] < best_by_road_rt["distance_km"]:
+                best_by_road = h
+                best_by_road_rt = rt
+
+        # 3) mask + route checks off the event loop
+        if not mask_built:
+            mask, sim_polygon = await run_geo(_build_mask, lat, lon, routed[0], candidates[0], *mask_args)
+            mask_built = True
+        hit = await run_geo(_first_clear, routed, mask, transtar_pts, tube_m)
+        if hit:
+            chosen, chosen_route = hit
+            break
+
+    if not mask_built:
+        # OSRM routed nothing; still report the simulated polygon like the sync route
+        mask, sim_polygon = await run_geo(_build_mask, lat, lon, None, candidates[0], *mask_args)
+
+    if not chosen:
+        chosen = best_by_road
+        chosen_route = best_by_road_rt
+        if chosen:
+            warning = "No fully clear route found. Route may cross areas under flood or near sensors."
+
+    return jsonify({
+        "origin": {"lat": lat, "lon": lon},
+        "best": chosen,
+        "route": chosen_route,
+        "radius_km": radius_km,
+        "warning": warning,
+        "sim_polygon": mapping(sim_polygon) if sim_polygon is not None else None
+    })
@@ -4,7 +4,7 @@ from config import DEFAULT_BBOX, FLOOD_BUFFER_METERS, TRANSTAR_POINT_BUFFER_METE
 from services.nws import flood_alert_polygons
 from services.fim import fim_polygons
 from services.transtar import get_transtar_points
-from utils.geo import union_polygons, buffer_meters, points_buffered
+from utils.geo import flood_mask_geojson, points_buffered
 
 bp = Blueprint("flood", __name__)
 
@@ -26,12 +26,7 @@ def flood_mask():
     alert_polys = flood_alert_polygons(bbox=bbox)  # list of geojson geoms
     fim_polys = fim_polygons(bbox=bbox)            # list of geojson geoms (may be empty)
 
-    unioned = union_polygons(alert_polys + fim_polys)
-    if unioned:
-        unioned = buffer_meters(unioned, FLOOD_BUFFER_METERS)
-        union_geojson = mapping(unioned)
-    else:
-        union_geojson = None
+    union_geojson = flood_mask_geojson(bbox, alert_polys + fim_polys, FLOOD_BUFFER_METERS)
 
     points = get_transtar_points()
     transtar_union = points_buffered(points, TRANSTAR_POINT_BUFFER_METERS) if points else None
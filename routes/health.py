@@ -1,7 +1,16 @@
 from flask import Blueprint
+from services import warmup
 
 bp = Blueprint("health", __name__)
 
 @bp.get("/health")
 def health():
-    return {"ok": True}
\ No newline at end of file
+    # liveness stays 200; readiness is reported alongside
+    st = warmup.status()
+    return {"ok": True, "ready": st["ready"], "warmup": st}
+
+@bp.get("/health/ready")
+def ready():
+    # for the load balancer: 503 until warm-up has finished
+    st = warmup.status()
+    return st, (200 if st["ready"] else 503)
@@ -1,5 +1,6 @@
-import requests, time
-from utils.cache import overpass_cache  # reuse cache infra
+import requests, time, asyncio
+from utils.cache import overpass_cache, cache_get, cache_set  # reuse cache infra
+from utils.aio import get_client, upstream_timeout, single_flight
 from config import DEFAULT_BBOX
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
@@ -8,16 +9,12 @@ def _inside_bbox(lat: float, lon: float, bbox):
     w, s, e, n = bbox
     return (s <= lat <= n) and (w <= lon <= e)
 
-def geocode(q: str, limit: int = 5, bbox=DEFAULT_BBOX, hard_bound: bool = True):
-    """
-    Forward geocoding via Nominatim (OSM), biased/bounded to Houston bbox.
-    Returns a list of {label, lat, lon}.
-    """
-    qkey = ("geocode", q.strip().lower(), limit, bbox, hard_bound)
-    if qkey in overpass_cache:
-        return overpass_cache[qkey]
+HEADERS = {
+    "User-Agent": "panaceas-passage/0.1 (contact: youremail@example.com)"
+}
 
-    params = {
+def _params(q: str, limit: int, bbox, hard_bound: bool):
+    return {
         "q": q,
         "format": "jsonv2",
         "addressdetails": 1,
@@ -27,14 +24,8 @@ def geocode(q: str, limit: int = 5, bbox=DEFAULT_BBOX, hard_bound: bool = True):
         "viewbox": f"{bbox[0]},{bbox[3]},{bbox[2]},{bbox[1]}",  # left,top,right,bottom (lon,lat)
         "bounded": 1 if hard_bound else 0,
     }
-    headers = {
-        "User-Agent": "panaceas-passage/0.1 (contact: youremail@example.com)"
-    }
-    time.sleep(0.2)  # be polite
-    r = requests.get(NOMINATIM_URL, params=params, headers=headers, timeout=20)
-    r.raise_for_status()
-    data = r.json()
 
+def _results(data, q: str, bbox):
     results = []
     for item in data:
         try:
@@ -47,10 +38,49 @@ def geocode(q: str, limit: int = 5, bbox=DEFAULT_BBOX, hard_bound: bool = True):
             continue
         label = item.get("display_name") or q
         results.append({"label": label, "lat": lat, "lon": lon})
+    return results
+
+def geocode(q: str, limit: int = 5, bbox=DEFAULT_BBOX, hard_bound: bool = True):
+    """
+    Forward geocoding via Nominatim (OSM), biased/bounded to Houston bbox.
+    Returns a list of {label, lat, lon}.
+    """
+    qkey = ("geocode", q.strip().lower(), limit, bbox, hard_bound)
+    hit = cache_get(overpass_cache, qkey)
+    if hit is not None:
+        return hit
+
+    time.sleep(0.2)  # be polite
+    r = requests.get(NOMINATIM_URL, params=_params(q, limit, bbox, hard_bound), headers=HEADERS, timeout=20)
+    r.raise_for_status()
+    results = _results(r.json(), q, bbox)
 
     # If nothing found and we were strict, relax once
     if not results and hard_bound:
         return geocode(q, limit=limit, bbox=bbox, hard_bound=False)
 
-    overpass_cache[qkey] = results
+    cache_set(overpass_cache, qkey, results)
     return results
+
+async def geocode_async(q: str, limit: int = 5, bbox=DEFAULT_BBOX, hard_bound: bool = True):
+    """
+    Async twin of geocode; same cache, same bbox relax-once behaviour.
+    """
+    qkey = ("geocode", q.strip().lower(), limit, bbox, hard_bound)
+    hit = cache_get(overpass_cache, qkey)
+    if hit is not None:
+        return hit
+
+    async def fetch():
+        await asyncio.sleep(0.2)  # be polite, without blocking the loop
+        r = await get_client().get(NOMINATIM_URL, params=_params(q, limit, bbox, hard_bound), headers=HEADERS, timeout=upstream_timeout(20))
+        r.raise_for_status()
+        results = _results(r.json(), q, bbox)
+
+        if not results and hard_bound:
+            return await geocode_async(q, limit=limit, bbox=bbox, hard_bound=False)
+
+        cache_set(overpass_cache, qkey, results)
+        return results
+
+    return await single_flight(qkey, fetch)
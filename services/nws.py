@@ -1,36 +1,70 @@
-import requests
-from utils.cache import alerts_cache
+import requests, asyncio
+from utils.cache import alerts_cache, cache_get, cache_set
+from utils.aio import get_client, upstream_timeout, single_flight
 
 BASE ="https://api.weather.gov/alerts"
+EVENTS = ["Flood Warning", "Flash Flood Warning"]
+HEADERS = {"Accept": "application/geo+json"}
 
-def flood_alert_polygons(bbox=None):
-    """
-     Returns a list of GeoJSON Polygon/MultiPolygon geometries for active Flood/Flash Flood Warnings.
-
-    """
-    key = ("alerts", bbox)
-    if key in alerts_cache:
-        return alerts_cache[key]
+def _params(event, bbox):
     params = {
         "status": "actual",
         "message_type": "alert",
-        "event": "Flood Warning",
+        "event": event,
         "limit": 200
     }
     if bbox:
         #format: west, south, east, north
         params["bbox"] = ",".join(map(str, bbox))
+    return params
+
+def _polygons(data):
+    geoms = []
+    for f in data.get("feature", []):
+        g = f.get("geometry")
+        if g and g.get("type") in ("Polygon","MultiPolygon"):
+            geoms.append(g)
+    return geoms
+
+def flood_alert_polygons(bbox=None):
+    """
+     Returns a list of GeoJSON Polygon/MultiPolygon geometries for active Flood/Flash Flood Warnings.
 
+    """
+    key = ("alerts", bbox)
+    hit = cache_get(alerts_cache, key)
+    if hit is not None:
+        return hit
     geoms = []
-    for event in ["Flood Warning", "Flash Flood Warning"]:
-        params["event"] = event
-        r = requests.get(BASE, params=params, timeout=20, headers={"Accept": "application/geo+json"})
+    for event in EVENTS:
+        r = requests.get(BASE, params=_params(event, bbox), timeout=20, headers=HEADERS)
         if r.status_code != 200:
             continue
-        data = r.json()
-        for f in data.get("feature", []):
-            g = f.get("geometry")
-            if g and g.get("type") in ("Polygon","MultiPolygon"):
-                geoms.append(g)
-    alerts_cache[key] = geoms
-    return geoms
\ No newline at end of file
+        geoms.extend(_polygons(r.json()))
+    cache_set(alerts_cache, key, geoms)
+    return geoms
+
+async def flood_alert_polygons_async(bbox=None):
+    """
+    Async twin of flood_alert_polygons; both event types are fetched concurrently.
+    """
+    key = ("alerts", bbox)
+    hit = cache_get(alerts_cache, key)
+    if hit is not None:
+        return hit
+
+    async def fetch():
+        client = get_client()
+        responses = await asyncio.gather(*(
+            client.get(BASE, params=_params(event, bbox), timeout=upstream_timeout(20), headers=HEADERS)
+            for event in EVENTS
+        ))
+        geoms = []
+        for r in responses:
+            if r.status_code != 200:
+                continue
+            geoms.extend(_polygons(r.json()))
+        cache_set(alerts_cache, key, geoms)
+        return geoms
+
+    return await single_flight(key, fetch)
@@ -1,4 +1,5 @@
-import requests, math, time
+import requests, math, time, asyncio
+from utils.aio import get_client, upstream_timeout
 
 OSRM_BASE = "https://router.project-osrm.org"
 
@@ -17,6 +18,21 @@ def _get(url, tries=3, sleep=0.4):
     print("[OSRM ERROR]", url, "->", last)
     return None
 
+async def _get_async(url, tries=3, sleep=0.4):
+    client = get_client()
+    last = None
+    for i in range(tries):
+        try:
+            r = await client.get(url, timeout=upstream_timeout(20))
+            if r.status_code == 200:
+                return r.json()
+            last = f"HTTP {r.status_code}: {r.text[:200]}"
+        except Exception as e:
+            last = str(e)
+        await asyncio.sleep(sleep * (i + 1))
+    print("[OSRM ERROR]", url, "->", last)
+    return None
+
 def distance_km(origin, dest):
     lat1, lon1 = origin; lat2, lon2 = dest
     url = f"{OSRM_BASE}/route/v1/driving/{lon1},{lat1};{lon2},{lat2}?overview=false&alternatives=false"
@@ -25,24 +41,39 @@ def distance_km(origin, dest):
         return math.inf
     return js["routes"][0]["distance"]/1000.0
 
+# Try a few param variants that sometimes dodge demo-server quirks
+ROUTE_VARIANTS = [
+    "overview=full&geometries=geojson&steps=false&alternatives=false",
+    "overview=full&geometries=geojson&steps=false&continue_straight=true",
+    "overview=simplified&geometries=geojson&steps=false",
+]
+
+def _route_from_js(js):
+    r = js["routes"][0]
+    return {
+        "distance_km": r["distance"]/1000.0,
+        "duration_min": r["duration"]/60.0,
+        "geometry": r["geometry"]
+    }
+
 def full_route(origin, dest):
     lat1, lon1 = origin; lat2, lon2 = dest
-    # Try a few param variants that sometimes dodge demo-server quirks
-    variants = [
-        "overview=full&geometries=geojson&steps=false&alternatives=false",
-        "overview=full&geometries=geojson&steps=false&continue_straight=true",
-        "overview=simplified&geometries=geojson&steps=false",
-    ]
-    for q in variants:
+    for q in ROUTE_VARIANTS:
         url = f"{OSRM_BASE}/route/v1/driving/{lon1},{lat1};{lon2},{lat2}?{q}"
         js = _get(url)
         if js and js.get("routes"):
-            r = js["routes"][0]
-            return {
-                "distance_km": r["distance"]/1000.0,
-                "duration_min": r["duration"]/60.0,
-                "geometry": r["geometry"]
-            }
+            return _route_from_js(js)
     # As a last resort, provide a straight line so the UI can still draw something
     print("[OSRM] no route; falling back to straight line geometry")
     return None
+
+async def full_route_async(origin, dest):
+    """Async twin of full_route; awaits OSRM without holding a worker."""
+    lat1, lon1 = origin; lat2, lon2 = dest
+    for q in ROUTE_VARIANTS:
+        url = f"{OSRM_BASE}/route/v1/driving/{lon1},{lat1};{lon2},{lat2}?{q}"
+        js = await _get_async(url)
+        if js and js.get("routes"):
+            return _route_from_js(js)
+    print("[OSRM] no route; falling back to straight line geometry")
+    return None
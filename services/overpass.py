@@ -1,5 +1,8 @@
 import requests
-from utils.cache import overpass_cache
+from utils.cache import overpass_cache, cache_get, cache_set
+from utils.aio import get_client, upstream_timeout, single_flight
+from utils.geo import haversine_km
+from config import DEFAULT_BBOX, HOSPITAL_GRID_STEPS
 import math
 
 ENDPOINTS = [
@@ -18,15 +21,47 @@ def bbox_around(lat: float, lon: float, radius_km: float):
     east  = lon + dlon
     return west, south, east, north  # Overpass wants (west,south,east,north)
 
+# Hospital catalog grid: HOSPITAL_GRID_STEPS x HOSPITAL_GRID_STEPS cells over
+# DEFAULT_BBOX, extended past it with the same spacing. Every origin in a cell
+# shares one cached catalog, so warm-up (and the first user) fills it for all.
+def _cell_size():
+    w, s, e, n = DEFAULT_BBOX
+    return (n - s) / HOSPITAL_GRID_STEPS, (e - w) / HOSPITAL_GRID_STEPS
+
+def cell_of(lat: float, lon: float):
+    dlat, dlon = _cell_size()
+    w, s = DEFAULT_BBOX[0], DEFAULT_BBOX[1]
+    return math.floor((lat - s) / dlat), math.floor((lon - w) / dlon)
+
+def cell_center(cell):
+    i, j = cell
+    dlat, dlon = _cell_size()
+    w, s = DEFAULT_BBOX[0], DEFAULT_BBOX[1]
+    return s + dlat * (i + 0.5), w + dlon * (j + 0.5)
+
+def bbox_cells():
+    """The cells covering DEFAULT_BBOX (what warm-up preloads)."""
+    return [(i, j) for i in range(HOSPITAL_GRID_STEPS) for j in range(HOSPITAL_GRID_STEPS)]
+
+def _catalog_radius_km(radius_km):
+    # radius + cell half-diagonal covers every origin in the cell; 111 km per degree
+    # on both axes over-estimates the lon side, which only makes the catalog larger
+    dlat, dlon = _cell_size()
+    return math.ceil(radius_km) + 0.5 * 111.0 * math.hypot(dlat, dlon)
+
+def _within(catalog, lat: float, lon: float, radius_km: float):
+    return [h for h in catalog if haversine_km((lat, lon), (h["lat"], h["lon"])) <= radius_km]
+
+HEADERS = {
+    "User-Agent": "panaceas-passage/0.1 (contact: demo@example.com)",
+    "Accept": "application/json"
+}
+
 def _post_overpass(query: str):
-    headers = {
-        "User-Agent": "panaceas-passage/0.1 (contact: demo@example.com)",
-        "Accept": "application/json"
-    }
     last_err = None
     for url in ENDPOINTS:
         try:
-            r = requests.post(url, data={"data": query}, headers=headers, timeout=30)
+            r = requests.post(url, data={"data": query}, headers=HEADERS, timeout=30)
             # Overpass sends 200 even for errors sometimes; check text too
             if r.status_code == 200:
                 return r.json()
@@ -36,15 +71,23 @@ def _post_overpass(query: str):
             last_err = f"{url} -> EXC {e}"
     raise RuntimeError(last_err or "All Overpass endpoints failed")
 
-def get_hospitals(lat: float, lon: float, radius_km: int = 20):
-    key = (round(lat, 3), round(lon, 3), int(radius_km))
-    if key in overpass_cache:
-        return overpass_cache[key]
+async def _post_overpass_async(query: str):
+    client = get_client()
+    last_err = None
+    for url in ENDPOINTS:
+        try:
+            r = await client.post(url, data={"data": query}, headers=HEADERS, timeout=upstream_timeout(30))
+            if r.status_code == 200:
+                return r.json()
+            else:
+                last_err = f"{url} -> HTTP {r.status_code} :: {r.text[:200]}"
+        except Exception as e:
+            last_err = f"{url} -> EXC {e}"
+    raise RuntimeError(last_err or "All Overpass endpoints failed")
 
+def _around_query(lat: float, lon: float, radius_km: int):
     radius_m = int(radius_km * 1000)
-
-    # --- First attempt: around: query (fast and tight)
-    around_query = f"""
+    return f"""
                     [out:json][timeout:25];
                     (
                     node["amenity"="hospital"](around:{radius_m},{lat},{lon});
@@ -54,13 +97,9 @@ def get_hospitals(lat: float, lon: float, radius_km: int = 20):
                     out center tags;
                     """.strip()
 
-    try:
-        data = _post_overpass(around_query)
-        elements = data.get("elements", [])
-    except Exception:
-        # --- Fallback: bbox query (Overpass sometimes rejects around)
-        w, s, e, n = bbox_around(lat, lon, radius_km)
-        bbox_query = f"""
+def _bbox_query(lat: float, lon: float, radius_km: int):
+    w, s, e, n = bbox_around(lat, lon, radius_km)
+    return f"""
                     [out:json][timeout:25];
                     (
                     node["amenity"="hospital"]({s},{w},{n},{e});
@@ -69,14 +108,8 @@ def get_hospitals(lat: float, lon: float, radius_km: int = 20):
                     );
                     out center tags;
                     """.strip()
-        try:
-            data = _post_overpass(bbox_query)
-            elements = data.get("elements", [])
-        except Exception as ee:
-            # Return empty list instead of 500; the route layer can handle it
-            # If you want to see the reason, print(ee)
-            elements = []
 
+def _parse_hospitals(elements):
     hospitals = []
     seen = set()
     for e in elements:
@@ -92,6 +125,54 @@ def get_hospitals(lat: float, lon: float, radius_km: int = 20):
             continue
         seen.add(sig)
         hospitals.append({"name": name, "lat": la, "lon": lo})
-
-    overpass_cache[key] = hospitals
     return hospitals
+
+def _fetch_catalog(cell, radius_km):
+    lat, lon = cell_center(cell)
+    fetch_km = _catalog_radius_km(radius_km)
+
+    # --- First attempt: around: query (fast and tight)
+    try:
+        data = _post_overpass(_around_query(lat, lon, fetch_km))
+        elements = data.get("elements", [])
+    except Exception:
+        # --- Fallback: bbox query (Overpass sometimes rejects around)
+        # Both failing raises instead of caching [] (a 429 would otherwise read as
+        # "no hospitals" for the whole TTL); the route layer logs it and soft-fails
+        data = _post_overpass(_bbox_query(lat, lon, fetch_km))
+        elements = data.get("elements", [])
+    return _parse_hospitals(elements)
+
+async def _fetch_catalog_async(cell, radius_km):
+    lat, lon = cell_center(cell)
+    fetch_km = _catalog_radius_km(radius_km)
+    try:
+        data = await _post_overpass_async(_around_query(lat, lon, fetch_km))
+        elements = data.get("elements", [])
+    except Exception:
+        data = await _post_overpass_async(_bbox_query(lat, lon, fetch_km))
+        elements = data.get("elements", [])
+    return _parse_hospitals(elements)
+
+def get_hospitals(lat: float, lon: float, radius_km: int = 20):
+    cell = cell_of(lat, lon)
+    key = ("catalog", cell, math.ceil(radius_km))
+    catalog = cache_get(overpass_cache, key)
+    if catalog is None:
+        catalog = _fetch_catalog(cell, radius_km)
+        cache_set(overpass_cache, key, catalog)
+    return _within(catalog, lat, lon, radius_km)
+
+async def get_hospitals_async(lat: float, lon: float, radius_km: int = 20):
+    """Async twin of get_hospitals; shares its cache and collapses concurrent misses."""
+    cell = cell_of(lat, lon)
+    key = ("catalog", cell, math.ceil(radius_km))
+    catalog = cache_get(overpass_cache, key)
+    if catalog is None:
+        async def fetch():
+            catalog = await _fetch_catalog_async(cell, radius_km)
+            cache_set(overpass_cache, key, catalog)
+            return catalog
+
+        catalog = await single_flight(key, fetch)
+    return _within(catalog, lat, lon, radius_km)
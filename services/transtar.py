@@ -1,10 +1,24 @@
 import requests
-from utils.cache import transtar_cache
+import httpx
+from utils.cache import transtar_cache, cache_get, cache_set
+from utils.aio import get_client, upstream_timeout, single_flight
 
 # URL for the TranStar Roadway Flood Warning data feed.
 # The official API documentation points to this sample URL.
 TRANSTAR_URL = "https://traffic.houstontranstar.org/api/roadwayfloodwarning_sample.json"
 
+def _alert_points(data):
+    points = []
+    # The API returns a dictionary with a 'result' key containing the list of sensors
+    for item in data.get("result", []):
+        # We only want to include points that are actively alerting
+        if item.get("IsStreamElevationAlert") == "True":
+            lat = item.get("Latitude")
+            lon = item.get("Longitude")
+            if lat is not None and lon is not None:
+                points.append((float(lat), float(lon)))
+    return points
+
 def get_transtar_points():
     """
     Fetches and returns a list of (lat, lon) tuples for active flood sensors
@@ -15,27 +29,40 @@ def get_transtar_points():
     that are actively reporting flooding.
     """
     key = "transtar_alert_points"
-    if key in transtar_cache:
-        return transtar_cache[key]
+    hit = cache_get(transtar_cache, key)
+    if hit is not None:
+        return hit
 
     try:
         r = requests.get(TRANSTAR_URL, timeout=15)
         r.raise_for_status()  # Raise an exception for bad status codes
-        data = r.json()
-
-        points = []
-        # The API returns a dictionary with a 'result' key containing the list of sensors
-        for item in data.get("result", []):
-            # We only want to include points that are actively alerting
-            if item.get("IsStreamElevationAlert") == "True":
-                lat = item.get("Latitude")
-                lon = item.get("Longitude")
-                if lat is not None and lon is not None:
-                    points.append((float(lat), float(lon)))
-
-        transtar_cache[key] = points
+        points = _alert_points(r.json())
+        cache_set(transtar_cache, key, points)
         return points
     except (requests.RequestException, ValueError) as e:
         # Log the error for debugging purposes
         print(f"Error fetching or parsing TranStar data: {e}")
         return []
+
+async def get_transtar_points_async():
+    """
+    Async twin of get_transtar_points. Shares the same cache, and concurrent
+    misses are collapsed into a single TranStar request.
+    """
+    key = "transtar_alert_points"
+    hit = cache_get(transtar_cache, key)
+    if hit is not None:
+        return hit
+
+    async def fetch():
+        try:
+            r = await get_client().get(TRANSTAR_URL, timeout=upstream_timeout(15))
+            r.raise_for_status()
+            points = _alert_points(r.json())
+            cache_set(transtar_cache, key, points)
+            return points
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Error fetching or parsing TranStar data: {e}")
+            return []
+
+    return await single_flight(key, fetch)
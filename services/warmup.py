@@ -0,0 +1,107 @@
+import os, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from shapely.geometry import Point
+
+from config import (
+    DEFAULT_BBOX,
+    DEFAULT_RADIUS_KM,
+    FLOOD_BUFFER_METERS,
+    WARMUP_ENABLED,
+    WARMUP_WORKERS,
+    WARMUP_MAX_SECONDS,
+)
+from services.nws import flood_alert_polygons
+from services.fim import fim_polygons
+from services.transtar import get_transtar_points
+from services.overpass import get_hospitals, bbox_cells, cell_center
+from utils.geo import union_polygons, buffer_meters, flood_mask_geojson
+
+# Startup warm-up: fill utils/cache and touch GEOS before the load balancer
+# sends traffic. Runs in a background thread of the process that serves;
+# /api/health reports progress. State is tagged with the PID so a forked worker
+# (gunicorn --preload) or a reloader child starts its own instead of inheriting it.
+_lock = threading.Lock()
+_state = {"pid": None, "started_at": None, "finished_at": None, "steps": {}}
+
+def hot_origins():
+    """Centre of each hospital catalog cell over DEFAULT_BBOX, as (lat, lon)."""
+    return [tuple(round(x, 3) for x in cell_center(cell)) for cell in bbox_cells()]
+
+def _warm_geometry():
+    # first GEOS union/buffer calls are noticeably slower than the rest
+    lon, lat = (DEFAULT_BBOX[0] + DEFAULT_BBOX[2]) / 2, (DEFAULT_BBOX[1] + DEFAULT_BBOX[3]) / 2
+    union_polygons([buffer_meters(Point(lon, lat), 100), buffer_meters(Point(lon + 0.001, lat), 100)])
+
+def _warm_hazards():
+    # same calls as /api/flood-mask with the default bbox
+    polys = flood_alert_polygons(bbox=DEFAULT_BBOX) + fim_polygons(bbox=DEFAULT_BBOX)
+    flood_mask_geojson(DEFAULT_BBOX, polys, FLOOD_BUFFER_METERS)  # fills mask_cache
+    get_transtar_points()
+
+def _warm_hospitals(lat, lon):
+    # fills the catalog for the whole cell, not just this point
+    get_hospitals(lat, lon, DEFAULT_RADIUS_KM)
+
+def _mark(name, status):
+    with _lock:
+        _state["steps"][name] = status
+
+def _step(name, fn):
+    try:
+        fn()
+        _mark(name, "ok")
+    except Exception as e:
+        # a failed step still counts as done; the request path will retry on demand
+        print("[WARMUP ERROR]", name, e)
+        _mark(name, "failed")
+
+def _run(steps):
+    _step("geometry", _warm_geometry)
+    with ThreadPoolExecutor(max_workers=WARMUP_WORKERS, thread_name_prefix="warmup") as pool:
+        for name, fn in steps:
+            pool.submit(_step, name, fn)
+    with _lock:
+        _state["finished_at"] = time.time()
+
+def start():
+    """Kick off warm-up once per serving process (later calls in the same PID are no-ops)."""
+    pid = os.getpid()
+    with _lock:
+        if _state["pid"] == pid:
+            return
+        _state.update(pid=pid, started_at=time.time(), finished_at=None, steps={})
+        if not WARMUP_ENABLED:
+            _state["finished_at"] = _state["started_at"]
+            return
+        steps = [("hazards", _warm_hazards)]
+        steps += [(f"hospitals@{lat},{lon}", partial(_warm_hospitals, lat, lon)) for lat, lon in hot_origins()]
+        _state["steps"] = {"geometry": "pending", **{name: "pending" for name, _ in steps}}
+
+    threading.Thread(target=_run, args=(steps,), name="warmup", daemon=True).start()
+
+def status():
+    """
+    Readiness snapshot for /api/health:
+      { "ready": bool, "done": int, "total": int, "elapsed_s": float, "timed_out": bool, "steps": {name: pending|ok|failed} }
+    """
+    with _lock:
+        if _state["pid"] == os.getpid():
+            started, finished = _state["started_at"], _state["finished_at"]
+            steps = dict(_state["steps"])
+        else:
+            # not started in this process (or inherited across fork): not ready
+            started, finished, steps = None, None, {}
+
+    elapsed = 0.0
+    if started is not None:
+        elapsed = (finished or time.time()) - started
+    timed_out = finished is None and started is not None and elapsed > WARMUP_MAX_SECONDS
+    return {
+        "ready": finished is not None or timed_out,
+        "done": sum(1 for s in steps.values() if s != "pending"),
+        "total": len(steps),
+        "elapsed_s": round(elapsed, 2),
+        "timed_out": timed_out,
+        "steps": steps,
+    }
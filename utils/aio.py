@@ -0,0 +1,59 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from config import ASYNC_MAX_UPSTREAM_CONNECTIONS, GEO_POOL_WORKERS
+
+# Shared helpers for the async serving mode (asgi.py).
+# One HTTP client per process so every upstream call reuses pooled connections,
+# and one thread pool for shapely (shapely 2 releases the GIL in GEOS calls).
+_client = None
+_geo_pool = ThreadPoolExecutor(max_workers=GEO_POOL_WORKERS, thread_name_prefix="geo")
+_inflight = {}
+
+def upstream_timeout(seconds):
+    """
+    httpx applies a scalar timeout to pool acquisition too; under load that turns
+    requests queued for one of the ASYNC_MAX_UPSTREAM_CONNECTIONS into PoolTimeouts.
+    Time out the upstream itself, but let requests wait for a connection.
+    """
+    return httpx.Timeout(seconds, pool=None)
+
+def get_client():
+    """Lazily create the process-wide httpx.AsyncClient (must be called inside the event loop)."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=ASYNC_MAX_UPSTREAM_CONNECTIONS,
+                max_keepalive_connections=ASYNC_MAX_UPSTREAM_CONNECTIONS,
+            ),
+            timeout=upstream_timeout(20),
+        )
+    return _client
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+async def run_geo(fn, *args, **kwargs):
+    """Run a CPU-heavy (shapely) function in the geometry thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_geo_pool, functools.partial(fn, *args, **kwargs))
+
+async def single_flight(key, fetch):
+    """
+    Collapse concurrent cache misses for the same key into one upstream call.
+    `fetch` is a zero-arg coroutine function; every waiter gets its result.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    # shield: one cancelled client must not cancel the fetch for everyone else
+    return await asyncio.shield(task)
@@ -1,5 +1,21 @@
+import threading
 from cachetools import TTLCache
 # In memory caches
-overpass_cache = TTLCache(maxsize=256, ttl=6) # 5 min
+overpass_cache = TTLCache(maxsize=256, ttl=300) # 5 min
 alerts_cache = TTLCache(maxsize=64, ttl=180) # 3 min
-transtar_cache = TTLCache(maxsize=64, ttl=180) # 2 min
\ No newline at end of file
+transtar_cache = TTLCache(maxsize=64, ttl=180) # 2 min
+mask_cache = TTLCache(maxsize=64, ttl=180) # 3 min, same keys as alerts_cache
+
+# TTLCache is not thread-safe (every get/set may expire entries and relink its
+# internal list). Flask threads, the warm-up pool and the async event loop all
+# share these caches, so go through the helpers below.
+cache_lock = threading.Lock()
+
+def cache_get(cache, key):
+    """Cached value for key, or None on a miss."""
+    with cache_lock:
+        return cache.get(key)
+
+def cache_set(cache, key, value):
+    with cache_lock:
+        cache[key] = value
@@ -1,6 +1,7 @@
 import math
 from shapely.geometry import shape, Point, LineString, Polygon, MultiPolygon, mapping
 from shapely.ops import unary_union
+from utils.cache import mask_cache, cache_get, cache_set
 
 # This function returns the straight-line distance using the haversine formal
 def haversine_km(a, b):
@@ -27,6 +28,20 @@ def union_polygons(geoms):
         return None
     return unary_union(polys)
 
+# Unioned + buffered flood mask as GeoJSON (or None), cached per bbox
+# why: the union is the expensive part of /api/flood-mask and the inputs only change when alerts refresh
+# input: bbox (cache key), the alert + FIM geometries, buffer in meters
+# The entry is reused only while the input list is unchanged (cheap: same cached dicts)
+def flood_mask_geojson(bbox, polys, meters):
+    key = ("mask", bbox, meters)
+    hit = cache_get(mask_cache, key)
+    if hit is not None and hit[0] == polys:
+        return hit[1]
+    unioned = union_polygons(polys)
+    geojson = mapping(buffer_meters(unioned, meters)) if unioned else None
+    cache_set(mask_cache, key, (polys, geojson))
+    return geojson
+
 # This function adds safety margin around a shape( this is for risk mitigation)
 #  Also to find floods close to route
 # input: a shaply goemetry, outputs the shapely geometry buffered 